@@ -12,19 +12,30 @@ Example JSON message:
 #####################################
 
 # Standard Library
-import json
 import os  # for file operations
 import sys  # to exit early
-import time
+import time  # to rate-limit chart redraws
 import pathlib
-from collections import defaultdict  # data structure for counting author occurrences
+from collections import Counter  # data structure for counting author occurrences
+
+# Read BUZZ_* settings from .env
+from dotenv import load_dotenv
 
 # Matplotlib for live plotting
 import matplotlib.pyplot as plt
 
+# Fast C JSON parser (accepts str or bytes)
+import orjson
+
+# OS-level file change notifications (inotify/FSEvents/ReadDirectoryChangesW)
+from watchfiles import watch
+
 # Local
+from utils.utils_chart import AuthorBarChart, get_max_authors
 from utils.utils_logger import logger
 
+load_dotenv()
+
 #####################################
 # Set up Paths read from the file the producer writes
 #####################################
@@ -41,7 +52,12 @@ logger.info(f"Data file: {DATA_FILE}")
 # Set up data structures
 #####################################
 
-author_counts = defaultdict(int)
+author_counts = Counter()
+
+# cap redraws per second so bursts of messages share one draw
+PLOT_FPS = float(os.getenv("BUZZ_PLOT_FPS", "10"))
+_last_draw = 0.0
+_chart_stale = False  # bar heights changed since the last draw
 
 #####################################
 # Set up live visuals
@@ -50,79 +66,65 @@ author_counts = defaultdict(int)
 fig, ax = plt.subplots()
 plt.ion()  # interactive mode for live updates
 
-# keep bar artists and a stable author order for smooth updates
-bars = None
-author_order = []
+ax.set_xlabel("Authors")
+ax.set_ylabel("Message Counts")
+ax.set_title("Author message counts by Albert Kabore")
+chart = AuthorBarChart(fig, ax, get_max_authors(), color="green")
+plt.show(block=False)  # open the window now; redraws only flush GUI events
 
 #####################################
 # Define an update chart function for live plotting
-# This runs every time a new message is processed
+# This runs once per burst of new lines
 #####################################
 
 def update_chart():
-    """Update the live chart with the latest author counts."""
-    global bars, author_order
-
-    # keep a stable order and append new authors when they appear
-    for a in author_counts.keys():
-        if a not in author_order:
-            author_order.append(a)
-
-    counts_list = [author_counts[a] for a in author_order]
-    x = list(range(len(author_order)))
-
-    if bars is None or len(bars) != len(author_order):
-        # first draw or author set changed
-        ax.clear()
-        bars = ax.bar(x, counts_list, color="green")
-
-        # set matching ticks and labels to avoid warnings
-        ax.set_xticks(x)
-        ax.set_xticklabels(author_order, rotation=45, ha="right")
+    """
+    Update the live chart with the latest author counts.
 
-        ax.set_xlabel("Authors")
-        ax.set_ylabel("Message Counts")
-        ax.set_title("Author message counts by Albert Kabore")
-        ax.set_ylim(0, max(counts_list) + 1 if counts_list else 1)
-        plt.tight_layout()
-    else:
-        # update existing bar heights in place
-        for rect, h in zip(bars, counts_list):
-            rect.set_height(h)
-        ax.set_ylim(0, max(counts_list) + 1 if counts_list else 1)
+    Draws are spaced at least 1/PLOT_FPS apart: a burst that lands sooner waits
+    out the rest of the frame, and lines written meanwhile join the next burst.
+    """
+    global _last_draw, _chart_stale
 
-    plt.draw()
-    plt.pause(0.01)
+    wait = _last_draw + 1.0 / max(PLOT_FPS, 1e-6) - time.perf_counter()
+    if wait > 0:
+        time.sleep(wait)
+    _last_draw = time.perf_counter()
+    _chart_stale = False
+    chart.redraw()
 
 #####################################
 # Process Message Function
 #####################################
 
-def process_message(message: str) -> None:
+def process_message(message: str | bytes) -> None:
     """
-    Process a single JSON message and update the chart.
+    Process a single JSON message and update the bar heights.
+    Drawing is left to the caller, once per burst of lines.
 
     Args:
-        message (str): The JSON message as a string.
+        message (str | bytes): The JSON message; bytes are parsed without decoding.
     """
+    global _chart_stale
+
     try:
-        logger.debug(f"Raw message: {message}")
-        message_dict: dict = json.loads(message)
-        logger.info(f"Processed JSON message: {message_dict}")
+        logger.debug("Raw message: {}", message)
+        message_dict: dict = orjson.loads(message)
+        logger.debug("Processed JSON message: {}", message_dict)
 
         if isinstance(message_dict, dict):
             author = message_dict.get("author", "unknown")
-            logger.info(f"Message received from author: {author}")
+            logger.info("Message received from author: {}", author)
 
             author_counts[author] += 1
-            logger.info(f"Updated author counts: {dict(author_counts)}")
-
-            update_chart()
-            logger.info("Chart updated successfully.")
+            chart.add(author)
+            # dict() copy happens only when DEBUG output is on
+            logger.opt(lazy=True).debug("Updated author counts: {}", lambda: dict(author_counts))
+            _chart_stale = True
         else:
             logger.error(f"Expected a dictionary but got: {type(message_dict)}")
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error(f"Invalid JSON message: {message}")
     except Exception as e:
         logger.error(f"Error processing message: {e}")
@@ -143,20 +145,31 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as file:
+        # binary mode: orjson parses the raw bytes, so no text decoding pass
+        with open(DATA_FILE, "rb") as file:
             file.seek(0, os.SEEK_END)
             print("Consumer is ready and waiting for new JSON messages...")
 
-            while True:
-                line = file.readline()
+            # hold any partial trailing line until the producer finishes writing it
+            pending = b""
 
-                if line.strip():
-                    process_message(line)
-                else:
-                    logger.debug("No new messages. Waiting...")
-                    time.sleep(0.5)
+            # block until the OS reports a change, then drain everything appended;
+            # watch() batches events for 1.6 s by default, far too long for a live chart
+            for _changes in watch(DATA_FILE, debounce=50, step=20):
+                chunk = file.read()
+                if not chunk:
                     continue
 
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        process_message(line)
+
+                # one draw per burst, never per line, so the burst's last message is on screen
+                if _chart_stale:
+                    update_chart()
+
     except KeyboardInterrupt:
         logger.info("Consumer interrupted by user.")
     except Exception as e:
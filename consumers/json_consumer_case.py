@@ -12,13 +12,14 @@ Example JSON message after deserialization
 
 # ---------- Imports ----------
 import os
-import json
 from collections import defaultdict
 
 from dotenv import load_dotenv
 import matplotlib.pyplot as plt
+import orjson
 
-from utils.utils_consumer import create_kafka_consumer
+from utils.utils_chart import AuthorBarChart, get_max_authors
+from utils.utils_consumer import create_kafka_consumer, get_fetch_config
 from utils.utils_logger import logger
 
 # ---------- Env ----------
@@ -35,78 +36,40 @@ def get_kafka_consumer_group_id() -> str:
     return group_id
 
 # ---------- Stream state ----------
-author_counts = defaultdict(int)
+author_counts = defaultdict(int)  # exact per-author tally, incl. those folded into "(other)"
 
 # ---------- Live figure ----------
 fig, ax = plt.subplots()
 plt.ion()
 
-# keep artists + stable order so we can update in place
-bars = None                  # BarContainer
-author_order: list[str] = [] # stable author order
-
-def update_chart():
-    """Update the live bar chart of author counts without clearing the axes."""
-    global bars, author_order
-
-    # append any newly-seen authors to maintain a stable order
-    for a in author_counts.keys():
-        if a not in author_order:
-            author_order.append(a)
-
-    counts_list = [author_counts[a] for a in author_order]
-    x = list(range(len(author_order)))
-
-    if bars is None or len(bars) != len(author_order):
-        # first draw or author set changed
-        ax.clear()
-        bars = ax.bar(x, counts_list, color="skyblue")
-
-        # set matching ticks/labels (prevents set_xticklabels warning)
-        ax.set_xticks(x)
-        ax.set_xticklabels(author_order, rotation=45, ha="right")
-
-        ax.set_xlabel("Authors")
-        ax.set_ylabel("Message Counts")
-        ax.set_title("JSON author counts by Albert Kabore")
-        ax.set_ylim(0, max(counts_list) + 1 if counts_list else 1)
-        plt.tight_layout()
-    else:
-        # update bar heights in place
-        for rect, h in zip(bars, counts_list):
-            rect.set_height(h)
-        ax.set_ylim(0, max(counts_list) + 1 if counts_list else 1)
-
-    plt.draw()
-    plt.pause(0.01)
+ax.set_xlabel("Authors")
+ax.set_ylabel("Message Counts")
+ax.set_title("JSON author counts by Albert Kabore")
+chart = AuthorBarChart(fig, ax, get_max_authors(), color="skyblue")
+plt.show(block=False)
 
 def process_message(message) -> None:
     """
-    Process a single JSON message from Kafka and update the chart.
-    Accepts bytes or str.
+    Process a single JSON message from Kafka and update the bar heights.
+    Accepts bytes or str. Drawing is left to the caller, once per poll batch.
     """
     try:
-        # Kafka may provide bytes; normalize to str
-        if isinstance(message, bytes):
-            message = message.decode("utf-8")
-
-        logger.debug(f"Raw message: {message}")
-        message_dict = json.loads(message)
-        logger.info(f"Processed JSON message: {message_dict}")
+        logger.debug("Raw message: {}", message)
+        # orjson parses bytes or str directly, no decode step needed
+        message_dict = orjson.loads(message)
+        logger.debug("Processed JSON message: {}", message_dict)
 
         if isinstance(message_dict, dict):
             author = message_dict.get("author", "unknown")
-            logger.info(f"Message received from author: {author}")
+            logger.info("Message received from author: {}", author)
 
             author_counts[author] += 1
-            logger.info(f"Updated author counts: {dict(author_counts)}")
-
-            update_chart()
-            logger.info("Chart updated successfully.")
+            chart.add(author)
+            logger.opt(lazy=True).debug("Updated author counts: {}", lambda: dict(author_counts))
         else:
             logger.error(f"Expected a dictionary but got: {type(message_dict)}")
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error(f"Invalid JSON message: {message}")
     except Exception as e:
         logger.error(f"Error processing message: {e}")
@@ -119,14 +82,30 @@ def main() -> None:
     group_id = get_kafka_consumer_group_id()
     logger.info(f"Consumer for topic '{topic}' and group '{group_id}'")
 
-    consumer = create_kafka_consumer(topic, group_id)
+    # let the broker batch records per fetch instead of replying per record
+    consumer = create_kafka_consumer(
+        topic,
+        group_id,
+        lambda raw: raw,  # keep values as bytes; orjson parses them without a decode
+        **get_fetch_config(),
+        max_poll_records=500,
+    )
 
     logger.info(f"Polling messages from topic '{topic}'")
     try:
-        for record in consumer:
-            message_value = record.value  # bytes or str
-            logger.debug(f"Offset {record.offset}: {message_value!r}")
-            process_message(message_value)
+        while True:
+            # one poll returns every record fetched so far; apply them all, then draw once
+            batch = consumer.poll(timeout_ms=500, max_records=500)
+            if not batch:
+                fig.canvas.flush_events()  # keep the window responsive while idle
+                continue
+            for records in batch.values():
+                for record in records:
+                    message_value = record.value  # raw bytes
+                    logger.debug("Offset {}: {!r}", record.offset, message_value)
+                    process_message(message_value)
+            chart.redraw()
+            logger.info("Chart updated successfully.")
     except KeyboardInterrupt:
         logger.warning("Consumer interrupted by user.")
     except Exception as e:
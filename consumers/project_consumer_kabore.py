@@ -22,6 +22,12 @@ Ingest mode (set in .env):
   PROJECT_INGEST_MODE=file  -> tails data/project_live.json
   PROJECT_INGEST_MODE=kafka -> consumes PROJECT_TOPIC with group PROJECT_CONSUMER_GROUP_ID
 
+Plot backend: TkAgg on Windows, matplotlib's default elsewhere; set
+MPLBACKEND (e.g. QtAgg) to choose another Agg-based GUI backend.
+
+consumers/csv_consumer_case.py is a thin entry point onto this module that
+defaults to Kafka ingest.
+
 Run (from repo root):
   - Activate venv:      .\.venv\Scripts\activate
   - Consumer:           py -m consumers.project_consumer_kabore
@@ -31,24 +37,30 @@ Run (from repo root):
 # ======================
 # Imports & ENV
 # ======================
-import os, json, time, random
+import gc, os, sys, math, platform, random, queue, threading
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Deque, Tuple, Dict
-from collections import deque, Counter
+from datetime import datetime, timezone
+from typing import Deque, Tuple, Dict, List
+from collections import deque
 
+import numpy as np
+import orjson
+from kafka.structs import OffsetAndMetadata
 from dotenv import load_dotenv
+from watchfiles import watch
 load_dotenv()
 
 # Logging & Kafka helper from your repo
 from utils.utils_logger import logger
-from utils.utils_consumer import create_kafka_consumer
+from utils.utils_consumer import create_kafka_consumer, get_fetch_config
 
 # ---- Matplotlib (Windows-friendly) ----
 import matplotlib
 try:
-    # TkAgg is dependable on Windows; silently continue if unavailable
-    if os.name == "nt":
+    # TkAgg (Agg rasterizer + Tk window) is dependable on Windows; an explicit
+    # MPLBACKEND (e.g. QtAgg) wins. Silently continue if unavailable.
+    if os.name == "nt" and not os.getenv("MPLBACKEND"):
         matplotlib.use("TkAgg")
 except Exception:
     pass
@@ -67,7 +79,7 @@ def _env_float(key, default):
     except: return default
 
 MODE      = _env_str("PROJECT_INGEST_MODE", "file")  # "file" or "kafka"
-TOPIC     = _env_str("PROJECT_TOPIC", "buzzline-topic")
+TOPIC     = _env_str("PROJECT_TOPIC", os.getenv("BUZZ_TOPIC", "buzzline-topic"))
 GROUP_ID  = _env_str("PROJECT_CONSUMER_GROUP_ID", "project_group_kabore")
 
 # Plot + analytics tuning
@@ -76,33 +88,226 @@ HIST_SIZE = _env_int("PROJECT_HISTORY_SIZE", 600)          # max sentiment point
 BAR_WIN   = _env_int("PROJECT_BAR_WINDOW", 200)            # last N msgs for bar chart
 TOPN      = _env_int("PROJECT_TOPN", 5)
 FPS       = _env_float("PROJECT_PLOT_FPS", 10.0)
+PLOT_STRIDE = max(_env_int("PROJECT_PLOT_STRIDE", 1), 1)  # plot every Nth message; avg uses all
+MAX_PLOT_POINTS = max(_env_int("PROJECT_MAX_PLOT_POINTS", 2000), 3)  # per line, after decimation
+
+# Kafka batching: records per poll and how long a poll may wait for them
+BATCH_SIZE       = max(_env_int("PROJECT_BATCH_SIZE", 500), 1)
+BATCH_TIMEOUT_MS = max(int(_env_float("PROJECT_BATCH_TIMEOUT", 0.1) * 1000), 1)
+
+# Garbage collection: gen-0 threshold while streaming (0 keeps Python's default)
+GC_GEN0   = _env_int("PROJECT_GC_GEN0", 50_000)
 
 # Visibility controls
 VERBOSE   = _env_int("PROJECT_VERBOSE", 1)                 # print each message
 SHOW_LAST = _env_int("PROJECT_SHOW_LAST", 1)               # show last msg on chart
 
+# Producer's category vocabulary; pre-coded so the common case never grows CAT_WIN
+CATEGORIES = ("humor", "tech", "food", "travel", "entertainment", "gaming", "other")
+
 # File path
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DATA_FILE = REPO_ROOT / "data" / "project_live.json"
+READ_CHUNK = 1 << 20  # max bytes taken from the file per read in file mode
 
 # ======================
 # Buffers
 # ======================
-TS: Deque[datetime]    = deque(maxlen=HIST_SIZE)
-SENT: Deque[float]     = deque(maxlen=HIST_SIZE)
-ROLLBUF: Deque[float]  = deque(maxlen=ROLL_N)
-ROLLAVG: Deque[float]  = deque(maxlen=HIST_SIZE)
-CATS: Deque[str]       = deque(maxlen=BAR_WIN)
+class SentimentHistory:
+    """Preallocated NumPy ring buffers for time, sentiment and rolling average.
+
+    Times are stored as matplotlib date numbers (float days), converted once per
+    batch on the way in, so set_data never re-converts the whole history.
+
+    Points arrive in batches: each batch is written with one slice/fancy-index
+    assignment. The rolling window keeps a running sum updated by +new - evicted,
+    so a batch of k points costs O(k) however large ROLL_N is; the sum is
+    re-synced with math.fsum every RESYNC_EVERY points to cancel float drift.
+
+    Each buffer is twice the history length and every point is written to both
+    halves, so the newest `size` points are always one contiguous slice and
+    views() never has to concatenate, even after the ring wraps.
+
+    With stride > 1 every point still feeds the rolling average, but only every
+    stride-th point (with its exact average) is kept for plotting.
+    """
+
+    RESYNC_EVERY = 10_000
+
+    def __init__(self, size: int, roll_n: int, stride: int = 1):
+        self.size = max(int(size), 1)
+        self.roll_n = max(int(roll_n), 1)
+        self.stride = max(int(stride), 1)
+        self._phase = 0     # points seen since the last one kept, mod stride
+        self.x_buf = np.empty(2 * self.size, dtype=np.float64)  # mdates numbers
+        self.v_buf = np.empty(2 * self.size, dtype=np.float32)
+        self.avg_buf = np.empty(2 * self.size, dtype=np.float32)
+        self.roll_buf = np.empty(self.roll_n, dtype=np.float64)  # ring of the last ROLL_N values
+        self.roll_start = 0     # oldest slot in roll_buf
+        self.roll_count = 0
+        self.roll_sum = 0.0
+        self._since_resync = 0
+        self.head = 0       # next slot to write in the history ring
+        self.n = 0          # valid points in the history ring
+
+    def __len__(self) -> int:
+        return self.n
+
+    def extend(self, ts: np.ndarray, vs: np.ndarray) -> None:
+        """Append a batch of datetime64[us] times and sentiment values."""
+        k = len(vs)
+        if k == 0:
+            return
 
-_last_draw = 0.0
+        avgs = self._roll(vs.astype(np.float64))
+
+        if self.stride > 1:
+            keep = slice((-self._phase) % self.stride, None, self.stride)
+            self._phase = (self._phase + k) % self.stride
+            ts, vs, avgs = ts[keep], vs[keep], avgs[keep]
+            k = len(vs)
+            if k == 0:
+                return
+
+        # only the newest `size` points can survive in the ring
+        if k > self.size:
+            ts, vs, avgs = ts[-self.size:], vs[-self.size:], avgs[-self.size:]
+            k = self.size
+        x = mdates.date2num(ts)
+        idx = (self.head + np.arange(k)) % self.size
+        for i in (idx, idx + self.size):  # primary slot and its mirror
+            self.x_buf[i] = x
+            self.v_buf[i] = vs
+            self.avg_buf[i] = avgs
+        self.head = (self.head + k) % self.size
+        self.n = min(self.n + k, self.size)
+
+    def _roll(self, new: np.ndarray) -> np.ndarray:
+        """Advance the rolling window by `new`; return the average after each point.
+
+        Think of the window (oldest-first) followed by `new` as one sequence.
+        Window sums are differences of its prefix sums, and only the oldest
+        min(k, count) window values - the ones this batch can evict - are read.
+        """
+        k, c, w = len(new), self.roll_count, self.roll_n
+        m = min(k, c)
+        oldest = self.roll_buf[(self.roll_start + np.arange(m)) % w]
+        prefix_old = np.concatenate(([0.0], np.cumsum(oldest)))
+        prefix_new = self.roll_sum + np.concatenate(([0.0], np.cumsum(new)))
+
+        end = np.arange(c + 1, c + k + 1)
+        start = np.maximum(end - w, 0)
+        # start <= c always indexes the evictable prefix (start <= m there)
+        start_sum = np.where(start <= c, prefix_old[np.minimum(start, m)],
+                             prefix_new[np.maximum(start - c, 0)])
+        sums = prefix_new[1:] - start_sum
+        avgs = sums / (end - start)
+
+        # keep the newest w values in the ring
+        if k >= w:
+            self.roll_buf[:] = new[-w:]
+            self.roll_start = 0
+        else:
+            evict = max(c + k - w, 0)
+            self.roll_start = (self.roll_start + evict) % w
+            slots = (self.roll_start + (c - evict) + np.arange(k)) % w
+            self.roll_buf[slots] = new
+        self.roll_count = min(c + k, w)
+        self.roll_sum = float(sums[-1])
+
+        self._since_resync += k
+        if self._since_resync >= self.RESYNC_EVERY:
+            self._since_resync = 0
+            self.roll_sum = math.fsum(self.roll_buf[:self.roll_count])
+        return avgs
+
+    def views(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (date numbers, sentiment, rolling avg) oldest-first, as zero-copy views."""
+        start = self.head if self.n == self.size else 0
+        window = slice(start, start + self.n)
+        return self.x_buf[window], self.v_buf[window], self.avg_buf[window]
+
+
+class CategoryWindow:
+    """The last `size` categories as small int codes in a ring, plus per-code counts.
+
+    Each category string is mapped to a code once (`known` first, then first-seen). A batch
+    overwrites its ring slots in one fancy-index assignment and moves `counts`
+    by a bincount of the codes entering minus those evicted, so the bar chart
+    never re-counts the window.
+    """
+
+    def __init__(self, size: int, known: Tuple[str, ...] = ()):
+        self.size = max(int(size), 1)
+        self.ids = np.zeros(self.size, dtype=np.int16)  # int16: unexpected categories get codes too
+        self.head = 0   # next slot to write
+        self.n = 0      # valid slots
+        self.code: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.counts = np.zeros(max(len(known), 8), dtype=np.int64)  # by code; grown as codes appear
+        for cat in known:
+            self._code(cat)
+
+    def _code(self, cat: str) -> int:
+        i = self.code.get(cat)
+        if i is None:
+            i = self.code[cat] = len(self.names)
+            self.names.append(cat)
+            if i == len(self.counts):
+                self.counts = np.concatenate((self.counts, np.zeros_like(self.counts)))
+        return i
+
+    def extend(self, cats: List[str]) -> None:
+        new = np.fromiter((self._code(c) for c in cats), dtype=np.int16, count=len(cats))
+        new = new[-self.size:]
+        k = len(new)
+        idx = (self.head + np.arange(k)) % self.size
+        evict = max(self.n + k - self.size, 0)  # the last `evict` slots hold live codes
+        if evict:
+            self.counts -= np.bincount(self.ids[idx[k - evict:]], minlength=len(self.counts))
+        self.ids[idx] = new
+        self.counts += np.bincount(new, minlength=len(self.counts))
+        self.head = (self.head + k) % self.size
+        self.n = min(self.n + k, self.size)
+
+    def top(self, n: int) -> Tuple[List[str], List[int]]:
+        """Return the `n` most frequent categories and counts, ties in code order."""
+        counts = self.counts[:len(self.names)]
+        # stable sort: equal counts stay in code order, like Counter.most_common
+        order = np.argsort(-counts, kind="stable")[:n]
+        order = order[counts[order] > 0]
+        return [self.names[i] for i in order], counts[order].tolist()
+
+
+HIST = SentimentHistory(HIST_SIZE, ROLL_N, PLOT_STRIDE)
+CAT_WIN = CategoryWindow(BAR_WIN, CATEGORIES)
+
+_dirty = False  # buffers changed since the last completed draw
+
+# Ingest thread -> GUI thread hand-off, one list of messages per item. Bounded
+# so a stalled GUI applies backpressure to the reader instead of growing memory.
+Q: "queue.Queue[List[Dict]]" = queue.Queue(maxsize=10_000)
+STOP = threading.Event()
+# Batches taken off Q and applied so far. Written only by the GUI thread; the
+# Kafka thread reads it to commit offsets no further than what was processed.
+APPLIED_BATCHES = 0
 
 # ======================
 # Helpers
 # ======================
+@lru_cache(maxsize=64)  # the producer repeats each second across several messages
 def parse_ts(ts_str: str) -> datetime:
     """Producer uses '%Y-%m-%d %H:%M:%S' (local, naive)."""
+    s = str(ts_str)
+    if len(s) == 19 and s[4] == s[7] == "-" and s[10] == " " and s[13] == s[16] == ":":
+        # fixed-width fast path: int() on slices instead of strptime
+        try:
+            return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                            int(s[11:13]), int(s[14:16]), int(s[17:19]))
+        except ValueError:
+            pass
     try:
-        return datetime.strptime(str(ts_str), "%Y-%m-%d %H:%M:%S")
+        return datetime.strptime(s, "%Y-%m-%d %H:%M:%S")
     except Exception:
         # fallback: ISO or similar
         try:
@@ -111,26 +316,9 @@ def parse_ts(ts_str: str) -> datetime:
             # last resort: truncate subseconds
             return datetime.strptime(str(ts_str)[:19], "%Y-%m-%d %H:%M:%S")
 
-def normalize_value(v) -> Dict:
-    """Kafka gives bytes due to value_serializer; file gives str per line."""
-    if isinstance(v, dict):  return v
-    if isinstance(v, bytes): v = v.decode("utf-8")
-    if isinstance(v, str):   return json.loads(v)
-    return json.loads(str(v))
-
-def should_draw() -> bool:
-    global _last_draw
-    min_interval = 1.0 / max(FPS, 1e-6)
-    now = time.perf_counter()
-    if now - _last_draw >= min_interval:
-        _last_draw = now
-        return True
-    return False
-
 def topn_counts() -> Tuple[list, list]:
-    c = Counter(CATS).most_common(TOPN)
-    if not c: return ["(none)"], [0]
-    labs = [k for k,_ in c]; vals = [v for _,v in c]
+    labs, vals = CAT_WIN.top(TOPN)
+    if not labs: return ["(none)"], [0]
     return labs, vals
 
 # ======================
@@ -143,137 +331,366 @@ try:
 except Exception:
     pass
 
-# Time series
-line_sent, = ax1.plot([], [], label="Sentiment")
-line_avg,  = ax1.plot([], [], label=f"Rolling avg ({ROLL_N})", linewidth=2)
+# Time series (animated: drawn by blitting on top of the cached background)
+line_sent, = ax1.plot([], [], label="Sentiment", animated=True)
+line_avg,  = ax1.plot([], [], label=f"Rolling avg ({ROLL_N})", linewidth=2, animated=True)
 ax1.set_title("Live Sentiment Trend — by Albert Kabore")
 ax1.set_xlabel("Time"); ax1.set_ylabel("Sentiment (0..1)")
 ax1.set_ylim(-0.05, 1.05); ax1.grid(True, alpha=.25); ax1.legend(loc="upper left")
 locator = mdates.AutoDateLocator(); formatter = mdates.ConciseDateFormatter(locator)
 ax1.xaxis.set_major_locator(locator); ax1.xaxis.set_major_formatter(formatter)
 
-# Bar chart
+# Bar chart: TOPN persistent bars, only heights and tick labels change
 ax2.set_title(f"Top {TOPN} Categories (last {BAR_WIN} messages)")
 ax2.set_xlabel("Category"); ax2.set_ylabel("Count"); ax2.grid(True, axis="y", alpha=.25)
+bars = ax2.bar(range(TOPN), [0] * TOPN, animated=True)
+bar_labels = [""] * TOPN
+ax2.set_xticks(range(TOPN)); ax2.set_xticklabels(bar_labels)
+ax2.set_xlim(-0.5, TOPN - 0.5); ax2.set_ylim(0, 1)
 
 # Status/overlay
 wait_text = fig.text(.5, .98, "Waiting for data from producer…", ha="center", va="top", fontsize=10, alpha=.7)
 last_text = ax1.text(
     0.01, 0.02, "", transform=ax1.transAxes, fontsize=9, alpha=0.9,
-    bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="0.8", alpha=0.85)
+    bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="0.8", alpha=0.85),
+    animated=True,
 )
 
+ANIMATED = [line_sent, line_avg, last_text, *bars]
+
+# Blitting state. A full draw (ticks, labels, limits) only happens when the
+# layout changes; every other frame restores this background and repaints
+# the animated artists.
+_bg = None
+_needs_full = True
+
+def _draw_animated():
+    for artist in ANIMATED:
+        artist.axes.draw_artist(artist)
+
+def _on_draw(event):
+    """After any full draw (incl. resize), re-capture the background."""
+    global _bg
+    _bg = fig.canvas.copy_from_bbox(fig.bbox)
+    _draw_animated()
+
+fig.canvas.mpl_connect("draw_event", _on_draw)
+
 plt.tight_layout(rect=[0,0,1,.96])
 plt.show(block=False)
 
+def _fit_xlim(x: np.ndarray) -> bool:
+    """Refit the time axis (date numbers) with headroom; True only when the limits moved."""
+    first, last = x[0], x[-1]
+    left, right = ax1.get_xlim()
+    span = max(last - first, 10 / 86400)  # at least 10 s, in days
+    if first >= left and last <= right and (first - left) <= 0.25 * span:
+        return False
+    ax1.set_xlim(first, last + 0.2 * span)
+    return True
+
+def _decimate(x: np.ndarray, sent: np.ndarray, avg: np.ndarray, buckets: int):
+    """Thin the series to ~2 points per bucket (one per pixel column) before set_data.
+
+    Sentiment is noisy, so each bucket keeps its min and max (the envelope a
+    full-resolution line would paint in that column). The rolling
+    average is smooth and just takes every bucket's first point. The newest
+    point is always kept so the line ends where the data does.
+    """
+    n = len(x)
+    if n <= 2 * buckets:
+        return (x, sent), (x, avg)
+    stride = -(-n // buckets)  # round up so there are never more than `buckets` buckets
+    starts = np.arange(0, n, stride)
+    lo = np.minimum.reduceat(sent, starts)
+    hi = np.maximum.reduceat(sent, starts)
+    env_t = np.repeat(x[starts], 2)
+    env_v = np.column_stack((lo, hi)).ravel()
+    avg_t = np.append(x[starts], x[-1])
+    avg_v = np.append(avg[starts], avg[-1])
+    return (np.append(env_t, x[-1]), np.append(env_v, sent[-1])), (avg_t, avg_v)
+
+def _update_bars(labs: list, vals: list) -> bool:
+    """Set bar heights in place; True when labels or y-limits changed."""
+    changed = False
+    labs = list(labs) + [""] * (TOPN - len(labs))
+    vals = list(vals) + [0] * (TOPN - len(vals))
+    if labs != bar_labels:
+        bar_labels[:] = labs
+        ax2.set_xticklabels(bar_labels)
+        changed = True
+    for rect, h in zip(bars, vals):
+        rect.set_height(h)
+    top = max(vals)
+    if top > ax2.get_ylim()[1]:
+        ax2.set_ylim(0, top * 1.25 + 1)
+        changed = True
+    return changed
+
 def redraw():
-    if not should_draw():
-        return
-    if TS:
-        line_sent.set_data(list(TS), list(SENT))
-        line_avg.set_data(list(TS), list(ROLLAVG))
-        ax1.relim(); ax1.autoscale_view(scalex=True, scaley=False)
+    """Push buffer state to the artists and blit. Runs on the GUI thread only."""
+    global _dirty, _needs_full
+    _dirty = False
+    if HIST:
+        x, sent, avg = HIST.views()
+        # ~2 points per pixel, never more than MAX_PLOT_POINTS per line (2 per bucket + the newest)
+        buckets = min(max(int(ax1.bbox.width), 1), (MAX_PLOT_POINTS - 1) // 2)
+        sent_xy, avg_xy = _decimate(x, sent, avg, buckets)
+        line_sent.set_data(*sent_xy)
+        line_avg.set_data(*avg_xy)
+        if _fit_xlim(x):
+            _needs_full = True
 
     labs, vals = topn_counts()
-    ax2.cla()
-    ax2.set_title(f"Top {TOPN} Categories (last {BAR_WIN} messages)")
-    ax2.set_xlabel("Category"); ax2.set_ylabel("Count"); ax2.grid(True, axis="y", alpha=.25)
-    ax2.bar(labs, vals)
+    if _update_bars(labs, vals):
+        _needs_full = True
 
-    fig.canvas.draw()
-    fig.canvas.flush_events()
-    plt.pause(0.05)
+    if _needs_full or _bg is None or not fig.canvas.supports_blit:
+        _needs_full = False
+        fig.canvas.draw_idle()  # _on_draw re-captures the background
+    else:
+        fig.canvas.restore_region(_bg)
+        _draw_animated()
+        fig.canvas.blit(fig.bbox)
+
+def _to_datetime64(t: datetime) -> np.datetime64:
+    """datetime64 has no zone; aware times are stored as naive UTC."""
+    if t.tzinfo is not None:
+        t = t.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(t, "us")
+
+def _plain_iso(s: str) -> bool:
+    """'YYYY-MM-DD[ T]HH:MM:SS[.ffffff]' with no zone suffix - the shape NumPy parses as-is."""
+    return len(s) >= 19 and s[4] == "-" and s[10] in " T" and "+" not in s and "-" not in s[11:]
+
+def parse_ts_batch(raw: List[str]) -> np.ndarray:
+    """Parse a batch of timestamps to datetime64[us]; unparseable entries become NaT.
+
+    The producer's 'YYYY-MM-DD HH:MM:SS' (and ISO with a trailing 'Z') is parsed
+    by NumPy in C in a single call. Anything else - offsets, bare years, epoch
+    numbers, odd formats - falls back to parse_ts per element.
+    """
+    plain = [s[:-1] if s.endswith("Z") else s for s in raw]
+    if all(map(_plain_iso, plain)):
+        try:
+            return np.array(plain, dtype="datetime64[us]")
+        except ValueError:
+            pass
+    out = np.empty(len(raw), dtype="datetime64[us]")
+    for i, s in enumerate(raw):
+        try:
+            out[i] = _to_datetime64(parse_ts(s))
+        except Exception:
+            out[i] = np.datetime64("NaT")
+    return out
+
+def process_batch(objs: List[Dict], is_real: bool):
+    """Append a batch of messages to the buffers in one pass; drawing is left to the GUI timer."""
+    global _dirty, _needs_full
+    tag = "REAL" if is_real else "SYNTH"
+    raw_ts, vals, cats = [], [], []
+    for obj in objs:
+        try:
+            ts  = obj.get("timestamp")
+            cat = obj.get("category", "other")
+            s   = obj.get("sentiment")
+            if ts is None or s is None:
+                logger.debug("Skipping incomplete message: {}", obj)
+                continue
+            v = float(s)
+        except Exception as e:
+            logger.error("Process error: {}", e)
+            continue
+
+        raw_ts.append(str(ts)); vals.append(v); cats.append(str(cat))
+        if VERBOSE:
+            logger.info("{} {} | {:<14} | sentiment={:.2f}", tag, ts, cat, v)
 
-def process_one(obj: Dict, is_real: bool):
-    """Update buffers, print/log, and redraw."""
-    try:
-        ts  = obj.get("timestamp")
-        cat = obj.get("category", "other")
-        s   = obj.get("sentiment")
-        if ts is None or s is None:
-            logger.debug(f"Skipping incomplete message: {obj}")
+    if not vals:
+        return
+
+    times = parse_ts_batch(raw_ts)
+    sent = np.fromiter(vals, dtype=np.float32, count=len(vals))
+    ok = ~np.isnat(times)
+    if not ok.all():
+        logger.error("Process error: skipped {} message(s) with bad timestamps", int((~ok).sum()))
+        times, sent = times[ok], sent[ok]
+        cats = [c for c, keep in zip(cats, ok) if keep]
+        if not cats:
             return
 
-        t = parse_ts(ts)
-        v = float(s)
+    HIST.extend(times, sent)
+    CAT_WIN.extend(cats)
+    _dirty = True
 
-        TS.append(t)
-        SENT.append(v)
-        ROLLBUF.append(v)
-        ROLLAVG.append(sum(ROLLBUF) / len(ROLLBUF))
-        CATS.append(str(cat))
+    if SHOW_LAST:
+        last_text.set_text(f"{tag} · {str(times[-1])[11:19]} · {cats[-1]} · s={sent[-1]:.2f}")
+    try:
+        if wait_text.get_text():
+            wait_text.set_text("")
+            _needs_full = True  # static text is part of the background
+    except Exception:
+        pass
 
-        tag = "REAL" if is_real else "SYNTH"
-        if VERBOSE:
-            logger.info(f"{tag} {t.strftime('%Y-%m-%d %H:%M:%S')} | {cat:<14} | sentiment={v:.2f}")
-        if SHOW_LAST:
-            last_text.set_text(f"{tag} · {t.strftime('%H:%M:%S')} · {cat} · s={v:.2f}")
+def drain_and_redraw():
+    """GUI timer callback: apply every queued batch, then draw once.
 
+    Errors are logged, never raised: TkAgg only re-arms the timer when this
+    returns normally, so one bad batch would otherwise freeze the chart.
+    """
+    global APPLIED_BATCHES
+    while True:
         try:
-            if wait_text.get_text():
-                wait_text.set_text("")
-        except Exception:
-            pass
-
-        redraw()
-    except Exception as e:
-        logger.error(f"Process error: {e}")
+            objs = Q.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            process_batch(objs, is_real=True)
+        except Exception as e:
+            logger.error("Batch dropped: {}", e)
+        APPLIED_BATCHES += 1  # handled either way; its offsets may be committed
+    if _dirty:
+        try:
+            redraw()
+        except Exception as e:
+            logger.error("Redraw failed: {}", e)
 
 # ======================
 # Loops
 # ======================
 def kafka_loop():
+    """Ingest thread: poll Kafka and queue parsed messages for the GUI thread.
+
+    Offsets are committed on this thread (kafka-python is not thread-safe), once
+    the GUI thread has applied the batch they belong to. Batches still queued
+    when the window closes are not committed and are re-read on the next run.
+    """
     logger.info(f"[KAFKA] topic='{TOPIC}' group='{GROUP_ID}'")
     try:
-        consumer = create_kafka_consumer(TOPIC, GROUP_ID)
+        # values stay raw bytes (no utf-8 decode); they are parsed below.
+        # let the broker coalesce records (see get_fetch_config), up to BATCH_SIZE per poll.
+        # offsets are committed below, per processed batch, not on the auto-commit timer
+        consumer = create_kafka_consumer(
+            TOPIC, GROUP_ID, lambda raw: raw,
+            **get_fetch_config(), max_poll_records=BATCH_SIZE,
+            enable_auto_commit=False,
+        )
     except Exception as e:
         logger.error(f"Kafka consumer init failed: {e}")
         return
 
+    queued = 0                            # batches put on Q by this thread
+    uncommitted: Deque[Tuple[int, Dict]] = deque()  # (queued count, next offsets) per poll
+
+    def commit_applied(sync: bool = False) -> None:
+        """Commit the offsets of every poll whose batch the GUI thread has applied."""
+        offsets = {}
+        while uncommitted and uncommitted[0][0] <= APPLIED_BATCHES:
+            offsets.update(uncommitted.popleft()[1])
+        if not offsets:
+            return
+        if sync:
+            consumer.commit(offsets)
+        else:
+            consumer.commit_async(offsets)
+
     try:
-        while True:
-            batch = consumer.poll(timeout_ms=500)
-            got = False
-            for _tp, msgs in batch.items():
+        while not STOP.is_set():
+            # one poll returns up to max_records; hand them over as a single batch
+            batch = consumer.poll(timeout_ms=BATCH_TIMEOUT_MS, max_records=BATCH_SIZE)
+            objs = []
+            for tp, msgs in batch.items():
                 for m in msgs:
-                    got = True
-                    process_one(normalize_value(m.value), is_real=True)
-            if not got:
-                redraw()
-    except KeyboardInterrupt:
-        logger.warning("Kafka consumer stopped.")
+                    try:
+                        # m.value is always bytes here (identity deserializer above),
+                        # so one orjson call replaces the old per-message type dispatch
+                        objs.append(orjson.loads(m.value))
+                    except Exception as e:
+                        logger.error("Bad Kafka message skipped: {}", e)
+            if objs:
+                Q.put(objs)
+                queued += 1
+            if batch:
+                # a poll with no usable records is done once everything before it is
+                uncommitted.append((queued, {
+                    tp: OffsetAndMetadata(msgs[-1].offset + 1, None)
+                    for tp, msgs in batch.items() if msgs
+                }))
+            commit_applied()  # at most one OffsetCommit per poll, never per record
+    except Exception as e:
+        logger.error(f"Kafka loop error: {e}")
     finally:
+        try: commit_applied(sync=True)  # only what the chart has applied
+        except Exception as e: logger.warning(f"Final offset commit failed: {e}")
         try: consumer.close()
         except: pass
+        logger.warning("Kafka consumer stopped.")
 
 def file_loop():
+    """Ingest thread: tail the data file and queue parsed messages for the GUI thread."""
     logger.info(f"[FILE] tailing: {DATA_FILE}")
     try:
-        with DATA_FILE.open("r", encoding="utf-8") as f:
-            f.seek(0, os.SEEK_END)  # tail
-            while True:
-                line = f.readline()
-                if not line:
-                    time.sleep(0.05)
-                    redraw()
-                    continue
-                try:
-                    process_one(json.loads(line), is_real=True)
-                except Exception as e:
-                    logger.error(f"Bad JSON line skipped: {e}")
+        # raw fd, bytes straight to orjson: no BufferedReader copy, no decode pass
+        fd = os.open(DATA_FILE, os.O_RDONLY | getattr(os, "O_BINARY", 0))
     except FileNotFoundError:
         logger.error(f"{DATA_FILE} not found. Start the producer or check path.")
-    except KeyboardInterrupt:
+        logger.warning("File loop stopped.")
+        return
+    try:
+        os.lseek(fd, 0, os.SEEK_END)  # tail
+        pending = b""                 # partial trailing line, completed by a later write
+        for _changes in watch(DATA_FILE, debounce=50, step=20, stop_event=STOP):
+            # drain in bounded reads; each read's complete lines become one batch
+            while chunk := os.read(fd, READ_CHUNK):
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                objs = []
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        objs.append(orjson.loads(line))
+                    except Exception as e:
+                        logger.error("Bad JSON line skipped: {}", e)
+                if objs:
+                    Q.put(objs)
+    finally:
+        os.close(fd)
         logger.warning("File loop stopped.")
 
-def main():
-    logger.info(f"START consumer | mode={MODE} | backend={matplotlib.get_backend()}")
-    if MODE.lower() == "kafka":
-        kafka_loop()
-    else:
-        file_loop()
+def main(mode: str = MODE):
+    """Run ingest on a worker thread and the matplotlib event loop on this one.
+
+    mode: "kafka" or "file"; defaults to PROJECT_INGEST_MODE.
+    """
+    logger.info(f"START consumer | mode={mode} | backend={matplotlib.get_backend()} | Python={sys.version.split()[0]} | OS={platform.system()}")
+    # Every message allocates short-lived dicts; move startup objects (matplotlib,
+    # NumPy, figure) out of the collector's view and let gen-0 collections run
+    # every GC_GEN0 allocations instead of every 700, i.e. a few times per burst
+    gc.collect()
+    gc.freeze()
+    if GC_GEN0 > 0:
+        _, gen1, gen2 = gc.get_threshold()
+        gc.set_threshold(GC_GEN0, gen1, gen2)
+
+    loop = kafka_loop if mode.strip().lower() == "kafka" else file_loop
+    worker = threading.Thread(target=loop, name="ingest", daemon=True)
+    worker.start()
+
+    # drain the queue and redraw at most FPS times per second, on the GUI thread
+    timer = fig.canvas.new_timer(interval=int(1000 / max(FPS, 1e-6)))
+    timer.add_callback(drain_and_redraw)
+    timer.start()
+
+    try:
+        plt.ioff()
+        plt.show()  # blocks until the window is closed
+    except KeyboardInterrupt:
+        logger.warning("Consumer interrupted by user.")
+    finally:
+        timer.stop()
+        STOP.set()
+        worker.join(timeout=2)
 
 if __name__ == "__main__":
     main()
-    plt.ioff()
-    plt.show()
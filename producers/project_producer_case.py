@@ -30,6 +30,7 @@ from dotenv import load_dotenv
 # Import Kafka only if available
 try:
     from kafka import KafkaProducer
+    from utils.utils_producer import get_kafka_compression_type
     KAFKA_AVAILABLE = True
 except ImportError:
     KAFKA_AVAILABLE = False
@@ -146,7 +147,8 @@ def main():
         try:
             producer = KafkaProducer(
                 bootstrap_servers=kafka_server,
-                value_serializer=lambda x: json.dumps(x).encode("utf-8")
+                value_serializer=lambda x: json.dumps(x).encode("utf-8"),
+                compression_type=get_kafka_compression_type(),
             )
             logger.info(f"Kafka producer connected to {kafka_server}")
         except Exception as e:
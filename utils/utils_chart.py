@@ -0,0 +1,119 @@
+"""
+utils_chart.py - live author bar chart shared by the buzz consumers.
+
+Bars are created once, one per author slot, and only their heights change.
+Steady-state frames blit the bars over a cached background; a full draw runs
+only when a new author or a taller bar changes ticks or limits.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import packages from Python Standard Library
+import os
+
+# Import external packages
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+#####################################
+# Default Configurations
+#####################################
+
+DEFAULT_MAX_AUTHORS = 20
+OTHER_AUTHORS = "(other)"
+
+
+#####################################
+# Helper Functions
+#####################################
+
+
+def get_max_authors() -> int:
+    """Fetch the number of author bars from environment or use default (at least 2)."""
+    return max(int(os.getenv("BUZZ_MAX_AUTHORS", DEFAULT_MAX_AUTHORS)), 2)
+
+
+class AuthorBarChart:
+    """
+    Per-author message counts as a bar chart that redraws cheaply.
+
+    The first max_authors - 1 authors get their own bar in first-seen order;
+    everyone after that is counted in a shared "(other)" bar.
+    """
+
+    def __init__(self, fig: Figure, ax: Axes, max_authors: int, color: str):
+        self.fig = fig
+        self.ax = ax
+        self.max_authors = max_authors
+        self.author_index: dict[str, int] = {}  # author -> bar slot
+        self.tick_labels: list[str] = [""] * max_authors
+        self.max_count = 0  # counts only grow, so the tallest bar is tracked, not searched
+
+        # animated bars are left out of the background and painted by blitting
+        self.bars = ax.bar(range(max_authors), [0] * max_authors, color=color, animated=True)
+        ax.set_xticks(range(max_authors))
+        ax.set_xticklabels(self.tick_labels, rotation=45, ha="right")
+        ax.set_xlim(-0.5, 0.5)
+        ax.set_ylim(0, 1)
+        # fixed margins leave room for rotated names without re-running tight_layout
+        fig.subplots_adjust(bottom=0.25, top=0.92)
+
+        self._background = None
+        self._layout_dirty = True  # ticks or limits changed since the last full draw
+        fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _visible_bars(self):
+        """Bars for assigned slots; the rest are empty and need no painting."""
+        return self.bars[:len(self.author_index)]
+
+    def _on_draw(self, event) -> None:
+        """After any full draw (incl. resize), re-capture the background and repaint."""
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for rect in self._visible_bars():
+            self.ax.draw_artist(rect)
+
+    def _slot_for(self, author: str) -> int:
+        idx = self.author_index.get(author)
+        if idx is not None:
+            return idx
+
+        if len(self.author_index) < self.max_authors - 1:
+            idx = len(self.author_index)
+            self.tick_labels[idx] = author
+        else:
+            idx = self.max_authors - 1
+            self.tick_labels[idx] = OTHER_AUTHORS
+        self.author_index[author] = idx
+
+        self.ax.set_xticklabels(self.tick_labels, rotation=45, ha="right")
+        if idx + 0.5 > self.ax.get_xlim()[1]:
+            self.ax.set_xlim(-0.5, idx + 0.5)
+        self._layout_dirty = True
+        return idx
+
+    def add(self, author: str) -> None:
+        """Count one message for an author. Nothing is drawn until redraw()."""
+        rect = self.bars[self._slot_for(author)]
+        height = rect.get_height() + 1
+        rect.set_height(height)
+        self.max_count = max(self.max_count, height)
+
+    def redraw(self) -> None:
+        """Show the current counts: blit the bars, or draw in full if the layout changed."""
+        if self.max_count + 1 > self.ax.get_ylim()[1]:
+            self.ax.set_ylim(0, self.max_count + 1)
+            self._layout_dirty = True
+
+        canvas = self.fig.canvas
+        if self._layout_dirty or self._background is None or not canvas.supports_blit:
+            canvas.draw_idle()  # _on_draw captures the new background
+            self._layout_dirty = False
+        else:
+            canvas.restore_region(self._background)
+            for rect in self._visible_bars():
+                self.ax.draw_artist(rect)
+            canvas.blit(self.fig.bbox)
+
+        canvas.flush_events()
@@ -9,7 +9,8 @@ Consumers subscribe to a topic and read messages from the Kafka topic.
 #####################################
 
 # Import packages from Python Standard Library
-from typing import Optional, Callable
+import os
+from typing import Any, Optional, Callable
 
 # Import external packages
 from kafka import KafkaConsumer
@@ -23,6 +24,9 @@ from .utils_producer import get_kafka_broker_address
 #####################################
 
 DEFAULT_CONSUMER_GROUP = "test_group"
+DEFAULT_FETCH_MIN_BYTES = 16_384
+DEFAULT_FETCH_MAX_WAIT_MS = 50
+DEFAULT_MAX_PARTITION_FETCH_BYTES = 5_242_880
 
 
 #####################################
@@ -30,10 +34,30 @@ DEFAULT_CONSUMER_GROUP = "test_group"
 #####################################
 
 
+def get_fetch_config() -> dict:
+    """
+    Fetch sizing for batched consumers, from environment or defaults.
+
+    The broker answers a fetch once fetch_min_bytes are ready or
+    fetch_max_wait_ms has passed, so raising them trades a little latency
+    for fewer, larger batches. Pass the result to create_kafka_consumer.
+    """
+    fetch_config = dict(
+        fetch_min_bytes=int(os.getenv("KAFKA_FETCH_MIN_BYTES", DEFAULT_FETCH_MIN_BYTES)),
+        fetch_max_wait_ms=int(os.getenv("KAFKA_FETCH_MAX_WAIT_MS", DEFAULT_FETCH_MAX_WAIT_MS)),
+        max_partition_fetch_bytes=int(
+            os.getenv("KAFKA_MAX_PARTITION_FETCH_BYTES", DEFAULT_MAX_PARTITION_FETCH_BYTES)
+        ),
+    )
+    logger.info(f"Kafka fetch config: {fetch_config}")
+    return fetch_config
+
+
 def create_kafka_consumer(
     topic_provided: Optional[str] = None,
     group_id_provided: Optional[str] = None,
     value_deserializer_provided: Optional[Callable[[bytes], str]] = None,
+    **consumer_config: Any,
 ):
     """
     Create and return a Kafka consumer instance.
@@ -44,6 +68,8 @@ def create_kafka_consumer(
         group_id_provided (str, optional): The consumer group ID.
             Defaults to test_group if not provided.
         value_deserializer_provided (callable, optional): Function to deserialize message values.
+        **consumer_config: Extra KafkaConsumer settings (e.g. fetch_min_bytes,
+            fetch_max_wait_ms, max_poll_records). These override the defaults below.
 
     Returns:
         KafkaConsumer: Configured Kafka consumer instance.
@@ -70,18 +96,22 @@ def create_kafka_consumer(
     )
     logger.debug(f"Kafka broker: {kafka_broker}")
 
+    config = dict(
+        group_id=consumer_group_id,
+        value_deserializer=value_deserializer,
+        bootstrap_servers=kafka_broker,
+        auto_offset_reset="earliest",
+        enable_auto_commit=True,
+        request_timeout_ms=30000,
+        session_timeout_ms=15000,
+        heartbeat_interval_ms=3000,
+    )
+    config.update(consumer_config)
+    if consumer_config:
+        logger.debug(f"Kafka consumer overrides: {consumer_config}")
+
     try:
-        consumer = KafkaConsumer(
-            topic,
-            group_id=consumer_group_id,
-            value_deserializer=value_deserializer,
-            bootstrap_servers=kafka_broker,
-            auto_offset_reset="earliest",
-            enable_auto_commit=True,
-            request_timeout_ms=30000,
-            session_timeout_ms=15000,
-            heartbeat_interval_ms=3000,
-        )
+        consumer = KafkaConsumer(topic, **config)
         logger.info("Kafka consumer created successfully.")
         return consumer
     except Exception as e:
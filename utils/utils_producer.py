@@ -17,6 +17,7 @@ from typing import Callable, Optional, Any
 # Import external packages
 from dotenv import load_dotenv
 from kafka import KafkaProducer, errors
+from kafka import codec as kafka_codec
 from kafka.admin import (
     KafkaAdminClient,
     NewTopic,
@@ -31,6 +32,7 @@ from utils.utils_logger import logger
 #####################################
 
 DEFAULT_KAFKA_BROKER_ADDRESS = "localhost:9092"
+DEFAULT_KAFKA_COMPRESSION_TYPE = "lz4"
 
 #####################################
 # Helper Functions
@@ -44,6 +46,30 @@ def get_kafka_broker_address():
     return broker_address
 
 
+def get_kafka_compression_type() -> Optional[str]:
+    """
+    Fetch the producer compression codec from environment or use default.
+
+    Consumers decompress whatever the producer chose, so this is the only
+    setting needed end to end. Falls back to gzip (always available) when the
+    library for the requested codec is not installed; "none" disables it.
+    """
+    codec = os.getenv("KAFKA_COMPRESSION_TYPE", DEFAULT_KAFKA_COMPRESSION_TYPE).strip().lower()
+    if codec in ("", "none"):
+        return None
+    available = {
+        "gzip": kafka_codec.has_gzip,
+        "snappy": kafka_codec.has_snappy,
+        "lz4": kafka_codec.has_lz4,
+        "zstd": kafka_codec.has_zstd,
+    }
+    if codec not in available or not available[codec]():
+        logger.warning(f"Kafka compression '{codec}' unavailable; using gzip.")
+        codec = "gzip"
+    logger.info(f"Kafka compression type: {codec}")
+    return codec
+
+
 #####################################
 # Kafka Readiness Check
 #####################################
@@ -109,6 +135,7 @@ def create_kafka_producer(
         producer = KafkaProducer(
             bootstrap_servers=kafka_broker,
             value_serializer=value_serializer,
+            compression_type=get_kafka_compression_type(),
         )
         logger.info("Kafka producer successfully created.")
         return producer